@@ -25,8 +25,9 @@ def install_auto_tracing(
     See `Logfire.install_auto_tracing` for more information.
     """
     if modules is None:
-        frame = inspect.stack()[2]
-        module = inspect.getmodule(frame[0])
+        # Only the caller's frame is needed, `inspect.stack()` would also read source lines for the whole stack.
+        frame = sys._getframe(2)  # type: ignore
+        module = inspect.getmodule(frame)
         if module is None:  # pragma: no cover
             raise KeyError('module not found')
         modules = modules_func_from_sequence([module.__name__.split('.')[0]])
@@ -3,6 +3,8 @@ from __future__ import annotations
 import importlib.metadata as metadata
 from functools import lru_cache
 
+from .utils import dump_json
+
 
 @lru_cache
 def collect_package_info() -> dict[str, str]:
@@ -14,3 +16,9 @@ def collect_package_info() -> dict[str, str]:
     distributions = metadata.distributions()
     distributions = sorted(distributions, key=lambda dist: (dist.name, dist.version))
     return {dist.name: dist.version for dist in distributions}
+
+
+@lru_cache
+def collect_package_info_json() -> str:
+    """The result of `collect_package_info` as compact JSON, e.g. for a resource attribute."""
+    return dump_json(collect_package_info())  # type: ignore
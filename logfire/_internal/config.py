@@ -8,7 +8,7 @@ import sys
 import time
 import warnings
 from dataclasses import dataclass, field
-from functools import cached_property
+from functools import cached_property, lru_cache
 from pathlib import Path
 from threading import RLock
 from typing import Any, Callable, Literal, Sequence, cast
@@ -18,8 +18,6 @@ from uuid import uuid4
 import requests
 from opentelemetry import metrics, trace
 from opentelemetry.environment_variables import OTEL_TRACES_EXPORTER
-from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
-from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
 from opentelemetry.sdk.environment_variables import (
     OTEL_BSP_SCHEDULE_DELAY,
     OTEL_EXPORTER_OTLP_METRICS_ENDPOINT,
@@ -35,23 +33,27 @@ from opentelemetry.sdk.metrics import (
     ObservableUpDownCounter,
     UpDownCounter,
 )
-from opentelemetry.sdk.metrics.export import AggregationTemporality, MetricReader, PeriodicExportingMetricReader
+from opentelemetry.sdk.metrics.export import AggregationTemporality, MetricReader
 from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import SpanProcessor, TracerProvider as SDKTracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor, SimpleSpanProcessor, SpanExporter
 from opentelemetry.sdk.trace.id_generator import IdGenerator, RandomIdGenerator
 from opentelemetry.sdk.trace.sampling import ParentBasedTraceIdRatio
 from opentelemetry.semconv.resource import ResourceAttributes
-from rich.console import Console
+from requests.adapters import DEFAULT_POOLSIZE as DEFAULT_POOL_MAXSIZE, HTTPAdapter
+from rich.console import Console, _is_jupyter  # type: ignore
 from rich.prompt import Confirm, Prompt
+from rich.style import Style
+from rich.text import Text
+from rich.theme import Theme
 from typing_extensions import Self
 
 from logfire.exceptions import LogfireConfigError
 from logfire.version import VERSION
 
 from .auth import DEFAULT_FILE, DefaultFile, is_logged_in
-from .collect_system_info import collect_package_info
-from .config_params import ParamManager, PydanticPluginRecordValues
+from .collect_system_info import collect_package_info_json
+from .config_params import ParamManager, PydanticPluginRecordValues, get_env, get_int_from_env, slots_true
 from .constants import (
     DEFAULT_FALLBACK_FILE_NAME,
     OTLP_MAX_BODY_SIZE,
@@ -66,7 +68,6 @@ from .exporters.console import (
 )
 from .exporters.fallback import FallbackSpanExporter
 from .exporters.file import FileSpanExporter
-from .exporters.otlp import OTLPExporterHttpSession, RetryFewerSpansSpanExporter
 from .exporters.processor_wrapper import SpanProcessorWrapper
 from .exporters.remove_pending import RemovePendingSpansExporter
 from .integrations.executors import instrument_executors
@@ -81,6 +82,8 @@ CREDENTIALS_FILENAME = 'logfire_credentials.json'
 COMMON_REQUEST_HEADERS = {'User-Agent': f'logfire/{VERSION}'}
 """Common request headers for requests to the Logfire API."""
 PROJECT_NAME_PATTERN = r'^[a-z0-9]+(?:-[a-z0-9]+)*$'
+_PROJECT_NAME_RE = re.compile(PROJECT_NAME_PATTERN)
+_PROJECT_NAME_INVALID_CHARS_RE = re.compile(r'[^a-zA-Z0-9]')
 
 METRICS_PREFERRED_TEMPORALITY = {
     Counter: AggregationTemporality.DELTA,
@@ -93,7 +96,7 @@ METRICS_PREFERRED_TEMPORALITY = {
 """This should be passed as the `preferred_temporality` argument of metric readers and exporters."""
 
 
-@dataclass
+@dataclass(**slots_true)
 class ConsoleOptions:
     """Options for controlling console output."""
 
@@ -158,6 +161,7 @@ def configure(
     scrubbing_patterns: Sequence[str] | None = None,
     scrubbing_callback: ScrubCallback | None = None,
     inspect_arguments: bool | None = None,
+    export_concurrency: int | None = None,
 ) -> None:
     """Configure the logfire SDK.
 
@@ -194,7 +198,9 @@ def configure(
         additional_span_processors: Span processors to use in addition to the default processor which exports spans to Logfire's API.
         default_span_processor: A function to create the default span processor. Defaults to `BatchSpanProcessor` from the OpenTelemetry SDK. You can configure the export delay for
             [`BatchSpanProcessor`](https://opentelemetry-python.readthedocs.io/en/latest/sdk/trace.export.html#opentelemetry.sdk.trace.export.BatchSpanProcessor)
-            by setting the `OTEL_BSP_SCHEDULE_DELAY_MILLIS` environment variable.
+            by setting the `OTEL_BSP_SCHEDULE_DELAY` environment variable, and its buffering with the `OTEL_BSP_MAX_QUEUE_SIZE`,
+            `OTEL_BSP_MAX_EXPORT_BATCH_SIZE` and `OTEL_BSP_EXPORT_TIMEOUT` environment variables.
+            A larger queue drops fewer spans when exporting is slow, at the cost of more memory.
         metric_readers: Legacy argument, use `additional_metric_readers` instead.
         additional_metric_readers: Sequence of metric readers to be used in addition to the default reader
             which exports metrics to Logfire's API.
@@ -214,6 +220,10 @@ def configure(
         inspect_arguments: Whether to enable f-string magic.
             If `None` uses the `LOGFIRE_INSPECT_ARGUMENTS` environment variable.
             Defaults to `True` if and only if the Python version is at least 3.11.
+        export_concurrency: Maximum number of batches of spans to export to Logfire at the same time.
+            If `None` uses the `LOGFIRE_EXPORT_CONCURRENCY` environment variable, otherwise defaults to `1`.
+            Higher values can keep up with more spans when requests to Logfire are slow.
+            Note that `logfire.force_flush()` doesn't wait for exports that are already in progress.
     """
     if processors is not None:  # pragma: no cover
         raise ValueError(
@@ -237,8 +247,8 @@ def configure(
         trace_sample_rate=trace_sample_rate,
         console=console,
         show_summary=show_summary,
-        config_dir=Path(config_dir) if config_dir else None,
-        data_dir=Path(data_dir) if data_dir else None,
+        config_dir=config_dir,
+        data_dir=data_dir,
         collect_system_metrics=collect_system_metrics,
         id_generator=id_generator,
         ns_timestamp_generator=ns_timestamp_generator,
@@ -251,17 +261,11 @@ def configure(
         scrubbing_patterns=scrubbing_patterns,
         scrubbing_callback=scrubbing_callback,
         inspect_arguments=inspect_arguments,
+        export_concurrency=export_concurrency,
     )
 
 
-def _get_int_from_env(env_var: str) -> int | None:
-    value = os.getenv(env_var)
-    if not value:
-        return None
-    return int(value)  # pragma: no cover
-
-
-@dataclasses.dataclass
+@dataclasses.dataclass(**slots_true)
 class _LogfireConfigData:
     """Data-only parent class for LogfireConfig.
 
@@ -271,6 +275,9 @@ class _LogfireConfigData:
     In particular, using this dataclass as a base class of LogfireConfig allows us to use
     `dataclasses.asdict` in `integrations/executors.py` to get a dict with just the attributes from
     `_LogfireConfigData`, and none of the attributes added in `LogfireConfig`.
+
+    The fields are stored in slots where possible. `LogfireConfig` doesn't define `__slots__`,
+    so its instances still have a `__dict__` for the other attributes it sets.
     """
 
     base_url: str
@@ -330,6 +337,9 @@ class _LogfireConfigData:
     scrubbing_callback: ScrubCallback | None
     """A function that is called for each match found by the scrubber."""
 
+    export_concurrency: int
+    """Maximum number of batches of spans to export to Logfire at the same time."""
+
     def _load_configuration(
         self,
         # note that there are no defaults here so that the only place
@@ -344,8 +354,8 @@ class _LogfireConfigData:
         trace_sample_rate: float | None,
         console: ConsoleOptions | Literal[False] | None,
         show_summary: bool | None,
-        config_dir: Path | None,
-        data_dir: Path | None,
+        config_dir: Path | str | None,
+        data_dir: Path | str | None,
         collect_system_metrics: bool | None,
         id_generator: IdGenerator | None,
         ns_timestamp_generator: Callable[[], int] | None,
@@ -358,13 +368,14 @@ class _LogfireConfigData:
         scrubbing_patterns: Sequence[str] | None,
         scrubbing_callback: ScrubCallback | None,
         inspect_arguments: bool | None,
+        export_concurrency: int | None,
     ) -> None:
         """Merge the given parameters with the environment variables file configurations."""
         param_manager = ParamManager.create(config_dir)
 
         self.base_url = param_manager.load_param('base_url', base_url)
-        self.metrics_endpoint = os.getenv(OTEL_EXPORTER_OTLP_METRICS_ENDPOINT) or urljoin(self.base_url, '/v1/metrics')
-        self.traces_endpoint = os.getenv(OTEL_EXPORTER_OTLP_TRACES_ENDPOINT) or urljoin(self.base_url, '/v1/traces')
+        self.metrics_endpoint = get_env(OTEL_EXPORTER_OTLP_METRICS_ENDPOINT) or urljoin(self.base_url, '/v1/metrics')
+        self.traces_endpoint = get_env(OTEL_EXPORTER_OTLP_TRACES_ENDPOINT) or urljoin(self.base_url, '/v1/traces')
 
         self.send_to_logfire = param_manager.load_param('send_to_logfire', send_to_logfire)
         self.token = param_manager.load_param('token', token)
@@ -373,9 +384,14 @@ class _LogfireConfigData:
         self.service_version = param_manager.load_param('service_version', service_version)
         self.trace_sample_rate = param_manager.load_param('trace_sample_rate', trace_sample_rate)
         self.show_summary = param_manager.load_param('show_summary', show_summary)
+        if isinstance(data_dir, str):
+            data_dir = Path(data_dir) if data_dir else None
         self.data_dir = param_manager.load_param('data_dir', data_dir)
         self.collect_system_metrics = param_manager.load_param('collect_system_metrics', collect_system_metrics)
         self.inspect_arguments = param_manager.load_param('inspect_arguments', inspect_arguments)
+        self.export_concurrency = param_manager.load_param('export_concurrency', export_concurrency)
+        if self.export_concurrency < 1:
+            raise LogfireConfigError(f'`export_concurrency` must be at least 1, got {self.export_concurrency}.')
         if self.inspect_arguments and sys.version_info[:2] <= (3, 8):
             raise LogfireConfigError(
                 'Inspecting arguments is only supported in Python 3.9+ and only recommended in Python 3.11+.'
@@ -418,7 +434,7 @@ class _LogfireConfigData:
         self.additional_span_processors = additional_span_processors
         self.default_span_processor = default_span_processor or _get_default_span_processor
         self.additional_metric_readers = additional_metric_readers
-        self.logfire_api_session = logfire_api_session or requests.Session()
+        self.logfire_api_session = logfire_api_session or _get_default_session()
         if self.service_version is None:
             try:
                 self.service_version = get_git_revision_hash()
@@ -440,8 +456,8 @@ class LogfireConfig(_LogfireConfigData):
         trace_sample_rate: float | None = None,
         console: ConsoleOptions | Literal[False] | None = None,
         show_summary: bool | None = None,
-        config_dir: Path | None = None,
-        data_dir: Path | None = None,
+        config_dir: Path | str | None = None,
+        data_dir: Path | str | None = None,
         collect_system_metrics: bool | None = None,
         id_generator: IdGenerator | None = None,
         ns_timestamp_generator: Callable[[], int] | None = None,
@@ -454,6 +470,7 @@ class LogfireConfig(_LogfireConfigData):
         scrubbing_patterns: Sequence[str] | None = None,
         scrubbing_callback: ScrubCallback | None = None,
         inspect_arguments: bool | None = None,
+        export_concurrency: int | None = None,
     ) -> None:
         """Create a new LogfireConfig.
 
@@ -487,6 +504,7 @@ class LogfireConfig(_LogfireConfigData):
             scrubbing_patterns=scrubbing_patterns,
             scrubbing_callback=scrubbing_callback,
             inspect_arguments=inspect_arguments,
+            export_concurrency=export_concurrency,
         )
         # initialize with no-ops so that we don't impact OTEL's global config just because logfire is installed
         # that is, we defer setting logfire as the otel global config until `configure` is called
@@ -510,8 +528,8 @@ class LogfireConfig(_LogfireConfigData):
         trace_sample_rate: float | None,
         console: ConsoleOptions | Literal[False] | None,
         show_summary: bool | None,
-        config_dir: Path | None,
-        data_dir: Path | None,
+        config_dir: Path | str | None,
+        data_dir: Path | str | None,
         collect_system_metrics: bool | None,
         id_generator: IdGenerator | None,
         ns_timestamp_generator: Callable[[], int] | None,
@@ -524,6 +542,7 @@ class LogfireConfig(_LogfireConfigData):
         scrubbing_patterns: Sequence[str] | None,
         scrubbing_callback: ScrubCallback | None,
         inspect_arguments: bool | None,
+        export_concurrency: int | None,
     ) -> None:
         with self._lock:
             self._initialized = False
@@ -551,11 +570,16 @@ class LogfireConfig(_LogfireConfigData):
                 scrubbing_patterns,
                 scrubbing_callback,
                 inspect_arguments,
+                export_concurrency,
             )
             self.initialize()
 
     def initialize(self) -> ProxyTracerProvider:
         """Configure internals to start exporting traces and metrics."""
+        if self._initialized:
+            # `configure` resets `_initialized` before reloading the configuration,
+            # so there's nothing to do here and no need to wait for the lock.
+            return self._tracer_provider
         with self._lock:
             return self._initialize()
 
@@ -566,12 +590,12 @@ class LogfireConfig(_LogfireConfigData):
         with suppress_instrumentation():
             otel_resource_attributes: dict[str, Any] = {
                 ResourceAttributes.SERVICE_NAME: self.service_name,
-                RESOURCE_ATTRIBUTES_PACKAGE_VERSIONS: json.dumps(collect_package_info(), separators=(',', ':')),
+                RESOURCE_ATTRIBUTES_PACKAGE_VERSIONS: collect_package_info_json(),
                 ResourceAttributes.PROCESS_PID: os.getpid(),
             }
             if self.service_version:
                 otel_resource_attributes[ResourceAttributes.SERVICE_VERSION] = self.service_version
-            otel_resource_attributes_from_env = os.getenv(OTEL_RESOURCE_ATTRIBUTES)
+            otel_resource_attributes_from_env = get_env(OTEL_RESOURCE_ATTRIBUTES)
             if otel_resource_attributes_from_env:
                 for _field in otel_resource_attributes_from_env.split(','):
                     key, value = _field.split('=', maxsplit=1)
@@ -634,6 +658,15 @@ class LogfireConfig(_LogfireConfigData):
             metric_readers = list(self.additional_metric_readers or [])
 
             if (self.send_to_logfire == 'if-token-present' and self.token is not None) or self.send_to_logfire is True:
+                # The OTLP exporters are only needed when sending data to Logfire,
+                # so don't slow down `import logfire` by importing them at the top of the module.
+                from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
+                from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+                from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
+
+                from .exporters.concurrent import ConcurrentSpanExporter
+                from .exporters.otlp import OTLPExporterHttpSession, RetryFewerSpansSpanExporter
+
                 credentials: LogfireCredentials | None = None
                 if self.token is None:
                     if (credentials := LogfireCredentials.load_creds_file(self.data_dir)) is None:  # pragma: no branch
@@ -654,19 +687,26 @@ class LogfireConfig(_LogfireConfigData):
                 if self.show_summary and credentials is not None:  # pragma: no cover
                     credentials.print_token_summary()
 
-                headers = {'User-Agent': f'logfire/{VERSION}', 'Authorization': self.token}
-                self.logfire_api_session.headers.update(headers)
+                # Don't put the token in `self.logfire_api_session`'s headers, since the default session is shared
+                # between configurations. Logfire API requests pass their headers explicitly.
+                headers = {**COMMON_REQUEST_HEADERS, 'Authorization': self.token}
 
                 session = OTLPExporterHttpSession(max_body_size=OTLP_MAX_BODY_SIZE)
+                if self.export_concurrency > DEFAULT_POOL_MAXSIZE:
+                    # Otherwise concurrent exports would open connections that can't be kept for reuse.
+                    adapter = HTTPAdapter(pool_maxsize=self.export_concurrency)
+                    session.mount('http://', adapter)
+                    session.mount('https://', adapter)
                 session.headers.update(headers)
-                otel_traces_exporter_env = os.getenv(OTEL_TRACES_EXPORTER)
-                otel_traces_exporter_env = otel_traces_exporter_env.lower() if otel_traces_exporter_env else None
+                otel_traces_exporter_env = (get_env(OTEL_TRACES_EXPORTER) or '').lower() or None
                 if otel_traces_exporter_env is None or otel_traces_exporter_env == 'otlp':
                     span_exporter = OTLPSpanExporter(endpoint=self.traces_endpoint, session=session)
                     span_exporter = RetryFewerSpansSpanExporter(span_exporter)
                     span_exporter = FallbackSpanExporter(
                         span_exporter, FileSpanExporter(self.data_dir / DEFAULT_FALLBACK_FILE_NAME, warn=True)
                     )
+                    if self.export_concurrency > 1:
+                        span_exporter = ConcurrentSpanExporter(span_exporter, max_inflight=self.export_concurrency)
                     span_exporter = RemovePendingSpansExporter(span_exporter)
                     add_span_processor(self.default_span_processor(span_exporter))
 
@@ -792,8 +832,35 @@ class LogfireConfig(_LogfireConfigData):
         )
 
 
+_DEFAULT_SESSION: requests.Session | None = None
+
+
+def _get_default_session() -> requests.Session:
+    """Get the session used to communicate with the Logfire API when the user didn't provide one.
+
+    The session is shared between configurations so that its connections can be reused,
+    so it mustn't hold any configuration-specific state such as the token.
+    """
+    global _DEFAULT_SESSION
+    if _DEFAULT_SESSION is None:
+        _DEFAULT_SESSION = requests.Session()
+    return _DEFAULT_SESSION
+
+
+def _reset_default_session() -> None:
+    """Forget the default session in a forked child so that it doesn't reuse the parent's connections."""
+    global _DEFAULT_SESSION
+    _DEFAULT_SESSION = None
+
+
+if hasattr(os, 'register_at_fork'):  # pragma: no branch
+    os.register_at_fork(after_in_child=_reset_default_session)
+
+
 def _get_default_span_processor(exporter: SpanExporter) -> SpanProcessor:
-    schedule_delay_millis = _get_int_from_env(OTEL_BSP_SCHEDULE_DELAY) or 500
+    # `BatchSpanProcessor` reads the other `OTEL_BSP_*` environment variables itself,
+    # only the schedule delay needs a different default.
+    schedule_delay_millis = get_int_from_env(OTEL_BSP_SCHEDULE_DELAY) or 500
     return BatchSpanProcessor(exporter, schedule_delay_millis=schedule_delay_millis)
 
 
@@ -831,21 +898,32 @@ class LogfireCredentials:
             LogfireConfigError: If the credentials file exists but is invalid.
         """
         path = _get_creds_file(creds_dir)
-        if path.exists():
-            try:
-                with path.open('rb') as f:
-                    data = json.load(f)
-            except (ValueError, OSError) as e:
-                raise LogfireConfigError(f'Invalid credentials file: {path}') from e
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        key = (cls, str(path))
+        cached = _CREDS_CACHE.get(key)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            # Return a copy so that changes made by one caller don't affect later loads.
+            return dataclasses.replace(cached[2])
 
-            try:
-                # Handle legacy key
-                dashboard_url = data.pop('dashboard_url', None)
-                if dashboard_url is not None:
-                    data.setdefault('project_url', dashboard_url)
-                return cls(**data)
-            except TypeError as e:
-                raise LogfireConfigError(f'Invalid credentials file: {path} - {e}') from e
+        try:
+            with path.open('rb') as f:
+                data = json.load(f)
+        except (ValueError, OSError) as e:
+            raise LogfireConfigError(f'Invalid credentials file: {path}') from e
+
+        try:
+            # Handle legacy key
+            dashboard_url = data.pop('dashboard_url', None)
+            if dashboard_url is not None:
+                data.setdefault('project_url', dashboard_url)
+            credentials = cls(**data)
+        except TypeError as e:
+            raise LogfireConfigError(f'Invalid credentials file: {path} - {e}') from e
+        _CREDS_CACHE[key] = (stat.st_mtime_ns, stat.st_size, dataclasses.replace(credentials))
+        return credentials
 
     @classmethod
     def _get_user_token(cls, logfire_api_url: str) -> str:
@@ -1087,7 +1165,7 @@ To create a write token, refer to https://docs.pydantic.dev/logfire/guides/advan
         while True:
             if force_project_name_prompt or not project_name:
                 project_name = Prompt.ask(project_name_prompt, default=project_name_default)
-            while project_name and not re.match(PROJECT_NAME_PATTERN, project_name):
+            while project_name and not _PROJECT_NAME_RE.match(project_name):
                 project_name = Prompt.ask(
                     "\nThe project name you've entered is invalid. Valid project names:\n"
                     '  * may contain lowercase alphanumeric characters\n'
@@ -1183,9 +1261,13 @@ To create a write token, refer to https://docs.pydantic.dev/logfire/guides/advan
     def write_creds_file(self, creds_dir: Path) -> None:
         """Write a credentials file to the given path."""
         ensure_data_dir_exists(creds_dir)
-        data = dataclasses.asdict(self)
+        # All fields are strings, so there's no need for the deep copy done by `dataclasses.asdict`.
+        data = {field.name: getattr(self, field.name) for field in dataclasses.fields(self)}
         path = _get_creds_file(creds_dir)
         path.write_text(json.dumps(data, indent=2) + '\n')
+        # The rewritten file may have the same size and mtime as before, so don't rely on those to invalidate the cache.
+        for key in [key for key in _CREDS_CACHE if key[1] == str(path)]:
+            del _CREDS_CACHE[key]
 
     def print_token_summary(self) -> None:
         """Print a summary of the existing project."""
@@ -1196,19 +1278,35 @@ To create a write token, refer to https://docs.pydantic.dev/logfire/guides/advan
             )
 
 
-def _print_summary(message: str, min_content_width: int) -> None:
-    from rich.console import Console
-    from rich.style import Style
-    from rich.theme import Theme
+# customise the link color since the default `blue` is too dark for me to read.
+_SUMMARY_THEME = Theme({'markdown.link_url': Style(color='cyan')})
 
-    # customise the link color since the default `blue` is too dark for me to read.
-    custom_theme = Theme({'markdown.link_url': Style(color='cyan')})
-    console = Console(stderr=True, theme=custom_theme)
+
+@lru_cache
+def _summary_console(min_content_width: int) -> Console:
+    console = Console(stderr=True, theme=_SUMMARY_THEME)
     if console.width < min_content_width + 4:  # pragma: no cover
         console.width = min_content_width + 4
-    console.print(message)
+    return console
+
+
+def _print_summary(message: str, min_content_width: int) -> None:
+    stderr = sys.stderr
+    if stderr is not None and not stderr.isatty() and not os.environ.get('FORCE_COLOR') and not _is_jupyter():
+        # Nothing would be styled anyway, so skip setting up a console and just strip the markup.
+        # Jupyter's stderr isn't a TTY either, but rich renders styled output there.
+        # When there's no stderr at all (e.g. under pythonw), leave it to rich, which handles that case.
+        stderr.write(Text.from_markup(message).plain + '\n')
+        return
+    _summary_console(min_content_width).print(message)
+
+
+_CREDS_CACHE: dict[tuple[type[LogfireCredentials], str], tuple[int, int, LogfireCredentials]] = {}
+"""The latest credentials loaded by `LogfireCredentials.load_creds_file` for each `(cls, path)`,
+along with the file's `mtime_ns` and size so that changed files are re-read."""
 
 
+@lru_cache(maxsize=32)
 def _get_creds_file(creds_dir: Path) -> Path:
     """Get the path to the credentials file."""
     return creds_dir / CREDENTIALS_FILENAME
@@ -1236,7 +1334,7 @@ def sanitize_project_name(name: str) -> str:
     """Convert `name` to a string suitable for the `requested_project_name` API parameter."""
     # Project names are limited to 50 characters, but the backend may also add 9 characters
     # if the project name already exists, so we limit it to 41 characters.
-    return re.sub(r'[^a-zA-Z0-9]', '', name).lower()[:41] or 'untitled'
+    return _PROJECT_NAME_INVALID_CHARS_RE.sub('', name).lower()[:41] or 'untitled'
 
 
 def default_project_name():
@@ -27,6 +27,40 @@ except ImportError:  # pragma: no cover
 
 T = TypeVar('T')
 
+_ENV_CACHE: dict[str, str | None] = {}
+"""Values of environment variables read since the last call to `clear_env_cache`."""
+_INT_ENV_CACHE: dict[str, int | None] = {}
+"""Integer values of environment variables read since the last call to `clear_env_cache`."""
+
+
+def get_env(env_var: str) -> str | None:
+    """Get the value of an environment variable, caching it until `clear_env_cache` is called."""
+    try:
+        return _ENV_CACHE[env_var]
+    except KeyError:
+        return _ENV_CACHE.setdefault(env_var, os.getenv(env_var))
+
+
+def get_int_from_env(env_var: str) -> int | None:
+    """Like `get_env`, but parses the value as an integer. Unset, empty and invalid values give `None`."""
+    try:
+        return _INT_ENV_CACHE[env_var]
+    except KeyError:
+        value = get_env(env_var)
+        try:
+            int_value = int(value) if value else None
+        except ValueError:
+            # Let the caller fall back to its default, e.g. OTel's `BatchSpanProcessor` warns and uses its own.
+            int_value = None
+        return _INT_ENV_CACHE.setdefault(env_var, int_value)
+
+
+def clear_env_cache() -> None:
+    """Clear cached environment variables so that they're read again, e.g. when logfire is reconfigured."""
+    _ENV_CACHE.clear()
+    _INT_ENV_CACHE.clear()
+
+
 slots_true = {'slots': True} if sys.version_info >= (3, 10) else {}
 
 PydanticPluginRecordValues = Literal['off', 'all', 'failure', 'metrics']
@@ -106,6 +140,8 @@ TRACE_SAMPLE_RATE = ConfigParam(env_vars=['LOGFIRE_TRACE_SAMPLE_RATE', 'OTEL_TRA
 """Default sampling ratio for traces. Can be overridden by the `logfire.sample_rate` attribute of a span."""
 INSPECT_ARGUMENTS = ConfigParam(env_vars=['LOGFIRE_INSPECT_ARGUMENTS'], allow_file_config=True, default=sys.version_info[:2] >= (3, 11), tp=bool)
 """Whether to enable the f-string magic feature. On by default for Python 3.11 and above."""
+EXPORT_CONCURRENCY = ConfigParam(env_vars=['LOGFIRE_EXPORT_CONCURRENCY'], allow_file_config=True, default=1, tp=int)
+"""Maximum number of batches of spans to export to Logfire at the same time."""
 # fmt: on
 
 CONFIG_PARAMS = {
@@ -129,6 +165,7 @@ CONFIG_PARAMS = {
     'pydantic_plugin_include': PYDANTIC_PLUGIN_INCLUDE,
     'pydantic_plugin_exclude': PYDANTIC_PLUGIN_EXCLUDE,
     'inspect_arguments': INSPECT_ARGUMENTS,
+    'export_concurrency': EXPORT_CONCURRENCY,
 }
 
 
@@ -140,8 +177,10 @@ class ParamManager:
     """Config loaded from the config file."""
 
     @classmethod
-    def create(cls, config_dir: Path | None = None) -> ParamManager:
-        config_dir = Path(config_dir or os.getenv('LOGFIRE_CONFIG_DIR') or '.')
+    def create(cls, config_dir: Path | str | None = None) -> ParamManager:
+        # Creating a param manager means (re)loading the configuration, so pick up any changed environment variables.
+        clear_env_cache()
+        config_dir = Path(config_dir or get_env('LOGFIRE_CONFIG_DIR') or '.')
         config_from_file = _load_config_from_file(config_dir)
         return ParamManager(config_from_file=config_from_file)
 
@@ -167,7 +206,7 @@ class ParamManager:
 
         param = CONFIG_PARAMS[name]
         for env_var in param.env_vars:
-            value = os.getenv(env_var)
+            value = get_env(env_var)
             # `None` (unset) and `''` (empty string) are generally considered the same
             if value:
                 return self._cast(value, name, param.tp)
@@ -198,6 +237,8 @@ class ParamManager:
             return _check_bool(value, name)  # type: ignore
         if tp is float:
             return float(value)  # type: ignore
+        if tp is int:
+            return int(value)  # type: ignore
         if tp is Path:
             return Path(value)  # type: ignore
         if get_origin(tp) is set and get_args(tp) == (str,):  # pragma: no branch
@@ -236,12 +277,24 @@ def _extract_set_of_str(value: str | set[str]) -> set[str]:
     return set(map(str.strip, value.split(','))) if isinstance(value, str) else value
 
 
+_TOML_CACHE: dict[str, tuple[int, int, dict[str, Any]]] = {}
+"""The latest `[tool.logfire]` section read from each config file, with the file's `mtime_ns` and size so that changed files are re-read."""
+
+
 def _load_config_from_file(config_dir: Path) -> dict[str, Any]:
     config_file = config_dir / 'pyproject.toml'
-    if not config_file.exists():
+    try:
+        stat = config_file.stat()
+    except OSError:
         return {}
+    key = str(config_file)
+    cached = _TOML_CACHE.get(key)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
     try:
         data = read_toml_file(config_file)
-        return data.get('tool', {}).get('logfire', {})
+        config_from_file = data.get('tool', {}).get('logfire', {})
     except Exception as exc:
         raise LogfireConfigError(f'Invalid config file: {config_file}') from exc
+    _TOML_CACHE[key] = (stat.st_mtime_ns, stat.st_size, config_from_file)
+    return config_from_file
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from threading import BoundedSemaphore, Lock
+from typing import Sequence
+from weakref import WeakSet
+
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+
+from ..utils import logger, suppress_instrumentation
+from .wrapper import WrapperSpanExporter
+
+
+class ConcurrentSpanExporter(WrapperSpanExporter):
+    """A SpanExporter that exports batches in background threads, with up to `max_inflight` exports at a time.
+
+    `BatchSpanProcessor` only exports one batch at a time, so when exporting is slow (e.g. an HTTP request)
+    spans can pile up and be dropped. This lets several batches be exported concurrently.
+
+    `export` returns `SUCCESS` as soon as the batch has been handed to a worker thread,
+    blocking only while `max_inflight` exports are already running.
+    The actual result is not reported, so the wrapped exporter should handle failures itself,
+    e.g. with a `FallbackSpanExporter`.
+    """
+
+    def __init__(self, exporter: SpanExporter, max_inflight: int) -> None:
+        super().__init__(exporter)
+        self._max_inflight = max_inflight
+        self._reinit()
+        _EXPORTERS.add(self)
+
+    def _reinit(self) -> None:
+        self._semaphore = BoundedSemaphore(self._max_inflight)
+        self._executor = ThreadPoolExecutor(max_workers=self._max_inflight, thread_name_prefix='logfire_export')
+        self._futures: set[Future[SpanExportResult]] = set()
+        self._lock = Lock()
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        self._semaphore.acquire()
+        try:
+            future = self._executor.submit(self._export, spans)
+        except RuntimeError:  # the executor has been shut down
+            self._semaphore.release()
+            return SpanExportResult.FAILURE
+        with self._lock:
+            self._futures.add(future)
+        future.add_done_callback(self._done)
+        return SpanExportResult.SUCCESS
+
+    def _export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        # The batch span processor suppresses instrumentation while exporting, but that context is lost in this thread.
+        with suppress_instrumentation():
+            return self.wrapped_exporter.export(spans)
+
+    def _done(self, future: Future[SpanExportResult]) -> None:
+        with self._lock:
+            self._futures.discard(future)
+        self._semaphore.release()
+        if (exception := future.exception()) is not None:
+            with suppress_instrumentation():  # prevent infinite recursion from the logging integration
+                logger.error('Exception while exporting spans', exc_info=exception)
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        with self._lock:
+            futures = list(self._futures)
+        _done, not_done = wait(futures, timeout=timeout_millis / 1000)
+        return not not_done and self.wrapped_exporter.force_flush(timeout_millis)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+        self.wrapped_exporter.shutdown()
+
+
+_EXPORTERS: WeakSet[ConcurrentSpanExporter] = WeakSet()
+"""The live `ConcurrentSpanExporter`s, so that they can all be reinitialized after a fork."""
+
+
+def _reinit_exporters_in_child() -> None:
+    # A forked child inherits the executors but not their worker threads,
+    # so nothing would ever be exported and `export` would eventually block forever.
+    for exporter in list(_EXPORTERS):
+        exporter._reinit()  # type: ignore
+
+
+if hasattr(os, 'register_at_fork'):  # pragma: no branch
+    os.register_at_fork(after_in_child=_reinit_exporters_in_child)
@@ -32,12 +32,15 @@ class OTLPExporterHttpSession(Session):
             else:
                 # assume a generator
                 body = cast('Iterable[bytes]', request.body)
+                max_body_size = self.max_body_size
 
                 def gen() -> Iterable[bytes]:
+                    # Check the running total so that we stop consuming the body as soon as it's too large.
                     total = 0
                     for chunk in body:
                         total += len(chunk)
-                        self._check_body_size(total)
+                        if total > max_body_size:
+                            raise BodyTooLargeError(total, max_body_size)
                         yield chunk
 
                 request.body = gen()  # type: ignore
@@ -246,7 +246,7 @@ class ChunksFormatter(Formatter):
         used_args: set[str | int] = set()
         # We currently don't use positional arguments
         args = ()
-        for literal_text, field_name, format_spec, conversion in self.parse(format_string):
+        for literal_text, field_name, format_spec, conversion in _parse_format_string(format_string):
             # output the literal text
             if literal_text:
                 result.append({'v': literal_text, 't': 'lit'})
@@ -333,6 +333,22 @@ class ChunksFormatter(Formatter):
 chunks_formatter = ChunksFormatter()
 
 
+_MAX_CACHED_FORMAT_STRING_LENGTH = 300
+"""Longer format strings are unlikely to be reused templates (e.g. pre-rendered messages or JSON), so aren't cached."""
+
+
+def _parse_format_string(format_string: str) -> tuple[tuple[str, str | None, str | None, str | None], ...]:
+    """`Formatter.parse`, cached for short strings since the same message templates are usually formatted over and over."""
+    if len(format_string) > _MAX_CACHED_FORMAT_STRING_LENGTH:
+        return tuple(chunks_formatter.parse(format_string))
+    return _parse_format_string_cached(format_string)
+
+
+@lru_cache(maxsize=256)
+def _parse_format_string_cached(format_string: str) -> tuple[tuple[str, str | None, str | None, str | None], ...]:
+    return tuple(chunks_formatter.parse(format_string))
+
+
 def logfire_format(format_string: str, kwargs: dict[str, Any], scrubber: Scrubber) -> str:
     result, _extra_attrs, _new_template = logfire_format_with_magic(
         format_string,
@@ -353,6 +369,9 @@ def logfire_format_with_magic(
     # 2. A dictionary of extra attributes to add to the span/log.
     #      These can come from evaluating values in f-strings.
     # 3. The final message template, which may differ from `format_string` if it was an f-string.
+    if fstring_frame is None and '{' not in format_string and '}' not in format_string:
+        # A plain message with no fields to fill in, e.g. `logfire.info('Done')`.
+        return format_string, {}, format_string
     chunks, extra_attrs, new_template = chunks_formatter.chunks(
         format_string,
         kwargs,
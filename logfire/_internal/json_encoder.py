@@ -4,6 +4,7 @@ import contextlib
 import dataclasses
 import datetime
 import json
+import sys
 from collections.abc import Mapping, Sequence
 from decimal import Decimal
 from enum import Enum
@@ -282,6 +283,9 @@ def logfire_json_dumps(obj: Any) -> str:
 
 
 def is_sqlalchemy(obj: Any) -> bool:
+    if 'sqlalchemy.orm' not in sys.modules:
+        # There can't be any SQLAlchemy models yet, and this avoids an import statement on every call.
+        return False
     try:
         from sqlalchemy.orm import DeclarativeBase, DeclarativeMeta
 
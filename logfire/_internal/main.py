@@ -108,7 +108,7 @@ class Logfire:
         console_log: bool = True,
         otel_scope: str = 'logfire',
     ) -> None:
-        self._tags = tuple(tags)
+        self._tags = uniquify_sequence(tags)
         self._config = config
         self._sample_rate = sample_rate
         self._console_log = console_log
@@ -176,9 +176,10 @@ class Logfire:
             if json_schema_properties := attributes_json_schema_properties(attributes):
                 otlp_attributes[ATTRIBUTES_JSON_SCHEMA_KEY] = attributes_json_schema(json_schema_properties)
 
-            tags = cast('tuple[str, ...]', (self._tags or ()) + tuple(_tags or ()))
+            # `self._tags` is already unique, so it can be used as is unless there are extra tags for this call.
+            tags = uniquify_sequence(self._tags + tuple(_tags)) if _tags else self._tags
             if tags:
-                otlp_attributes[ATTRIBUTES_TAGS_KEY] = uniquify_sequence(tags)
+                otlp_attributes[ATTRIBUTES_TAGS_KEY] = tags
 
             sample_rate = (
                 self._sample_rate
@@ -630,9 +631,9 @@ class Logfire:
             if json_schema_properties := attributes_json_schema_properties(attributes):
                 otlp_attributes[ATTRIBUTES_JSON_SCHEMA_KEY] = attributes_json_schema(json_schema_properties)
 
-            tags = self._tags + tuple(tags or ())
+            tags = uniquify_sequence(self._tags + tuple(tags)) if tags else self._tags
             if tags:
-                otlp_attributes[ATTRIBUTES_TAGS_KEY] = uniquify_sequence(tags)
+                otlp_attributes[ATTRIBUTES_TAGS_KEY] = tags
 
             sample_rate = (
                 self._sample_rate
@@ -1796,7 +1797,11 @@ def set_user_attribute(
     The key will be the original key unless the value was `None`, in which case it will be `NULL_ARGS_KEY`.
     """
     otel_value: otel_types.AttributeValue
-    if value is None:
+    # Most attributes (including the message, template and code location) are plain strings,
+    # so check for that exact type first before the more general checks below.
+    if type(value) is str:  # noqa: E721
+        otel_value = value
+    elif value is None:
         otel_value = cast('list[str]', otlp_attributes.get(NULL_ARGS_KEY, [])) + [key]
         key = NULL_ARGS_KEY
     elif isinstance(value, int):
@@ -209,7 +209,11 @@ def is_instrumentation_suppressed() -> bool:
 
     This means that any logs/spans generated by logfire or OpenTelemetry will not be logged in any way.
     """
-    return any(context.get_value(key) for key in SUPPRESS_INSTRUMENTATION_CONTEXT_KEYS)
+    current_context = context.get_current()
+    for key in SUPPRESS_INSTRUMENTATION_CONTEXT_KEYS:
+        if current_context.get(key):
+            return True
+    return False
 
 
 @contextmanager
@@ -375,25 +375,44 @@ def _pydantic_plugin_config() -> PydanticPlugin:
 
 def _include_model(schema_type_path: SchemaTypePath) -> bool:
     """Check whether a model should be instrumented."""
-    config = _pydantic_plugin_config()
-    include = config.include
-    exclude = config.exclude
+    include, exclude = _compiled_patterns(_pydantic_plugin_config())
 
     # check if the model is in ignored model
     module = schema_type_path.module
     if module.startswith(IGNORED_MODULE_PREFIXES) or module in IGNORED_MODULES:  # pragma: no cover
         return False
 
+    model_path = f'{module}::{schema_type_path.name}'
+
     # check if the model is in exclude models
-    if exclude and any(re.search(f'{pattern}$', f'{module}::{schema_type_path.name}') for pattern in exclude):
+    if exclude and any(pattern.search(model_path) for pattern in exclude):
         return False
 
     # check if the model is in include models
     if include:
-        return any(re.search(f'{pattern}$', f'{module}::{schema_type_path.name}') for pattern in include)
+        return any(pattern.search(model_path) for pattern in include)
     return True
 
 
+_compiled_patterns_cache: tuple[PydanticPlugin, tuple[re.Pattern[str], ...], tuple[re.Pattern[str], ...]] | None = None
+"""The last plugin settings passed to `_compiled_patterns` and their compiled `include`/`exclude` patterns."""
+
+
+def _compiled_patterns(config: PydanticPlugin) -> tuple[tuple[re.Pattern[str], ...], tuple[re.Pattern[str], ...]]:
+    """Compile the `include`/`exclude` patterns so that they're matched at the end of the model path.
+
+    The settings object only changes when logfire is configured, so the result is reused until then.
+    """
+    global _compiled_patterns_cache
+    cached = _compiled_patterns_cache
+    if cached is not None and cached[0] is config:
+        return cached[1], cached[2]
+    include = tuple(re.compile(f'{pattern}$') for pattern in config.include)
+    exclude = tuple(re.compile(f'{pattern}$') for pattern in config.exclude)
+    _compiled_patterns_cache = (config, include, exclude)
+    return include, exclude
+
+
 @lru_cache  # only patch once
 def _patch_build_wrapper():
     """The old pydantic plugin API required managing state between event handler methods.
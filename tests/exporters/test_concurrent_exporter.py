@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import gc
+import os
+import threading
+import time
+import weakref
+from typing import Sequence
+
+import pytest
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+from opentelemetry.trace import SpanContext
+
+from logfire._internal.exporters.concurrent import _EXPORTERS, ConcurrentSpanExporter  # type: ignore
+from logfire._internal.utils import is_instrumentation_suppressed
+
+
+class BlockingExporter(SpanExporter):
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.exported: list[ReadableSpan] = []
+        self.running = 0
+        self.max_running = 0
+        self.suppressed: list[bool] = []
+        self.lock = threading.Lock()
+        self.shutdown_called = False
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            self.suppressed.append(is_instrumentation_suppressed())
+        self.release.wait(5)
+        with self.lock:
+            self.running -= 1
+            self.exported.extend(spans)
+        return SpanExportResult.SUCCESS
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return True
+
+    def shutdown(self) -> None:
+        self.shutdown_called = True
+
+
+def make_span(span_id: int) -> ReadableSpan:
+    return ReadableSpan(name=f'span{span_id}', context=SpanContext(trace_id=1, span_id=span_id, is_remote=False))
+
+
+def test_concurrent_export() -> None:
+    wrapped = BlockingExporter()
+    exporter = ConcurrentSpanExporter(wrapped, max_inflight=2)
+
+    assert exporter.export([make_span(1)]) is SpanExportResult.SUCCESS
+    assert exporter.export([make_span(2)]) is SpanExportResult.SUCCESS
+
+    # A third export has to wait for one of the first two to finish.
+    third_exported = threading.Event()
+    thread = threading.Thread(target=lambda: exporter.export([make_span(3)]) and third_exported.set())
+    thread.start()
+    assert not third_exported.wait(0.1)
+
+    wrapped.release.set()
+    thread.join()
+    assert third_exported.is_set()
+
+    assert exporter.force_flush()
+    assert sorted(span.name for span in wrapped.exported) == ['span1', 'span2', 'span3']
+    assert wrapped.max_running == 2
+    assert wrapped.suppressed == [True, True, True]
+
+    exporter.shutdown()
+    assert wrapped.shutdown_called
+    assert exporter.export([make_span(4)]) is SpanExportResult.FAILURE
+
+
+def test_shutdown_waits_for_exports() -> None:
+    wrapped = BlockingExporter()
+    exporter = ConcurrentSpanExporter(wrapped, max_inflight=4)
+    exporter.export([make_span(1)])
+    threading.Timer(0.05, wrapped.release.set).start()
+    exporter.shutdown()
+    assert [span.name for span in wrapped.exported] == ['span1']
+
+
+class FailingExporter(SpanExporter):
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        raise ValueError('export failed')
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return True
+
+
+def test_export_exception_logged(caplog: pytest.LogCaptureFixture) -> None:
+    exporter = ConcurrentSpanExporter(FailingExporter(), max_inflight=2)
+    assert exporter.export([make_span(1)]) is SpanExportResult.SUCCESS
+    assert exporter.force_flush()
+    exporter.shutdown()
+
+    [record] = caplog.records
+    assert record.levelname == 'ERROR'
+    assert record.message == 'Exception while exporting spans'
+    assert record.exc_info is not None
+    assert str(record.exc_info[1]) == 'export failed'
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='requires os.fork')
+def test_export_after_fork() -> None:
+    wrapped = BlockingExporter()
+    exporter = ConcurrentSpanExporter(wrapped, max_inflight=2)
+    # Start both worker threads before forking, by keeping the first export busy while the second is submitted.
+    exporter.export([make_span(1)])
+    exporter.export([make_span(2)])
+    wrapped.release.set()
+    assert exporter.force_flush()
+
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover
+        ok = False
+        try:
+            wrapped.exported.clear()
+            for span_id in range(3, 8):
+                exporter.export([make_span(span_id)])
+            ok = exporter.force_flush(timeout_millis=5000) and len(wrapped.exported) == 5
+        finally:
+            os._exit(0 if ok else 1)  # type: ignore
+
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        waited_pid, status = os.waitpid(pid, os.WNOHANG)
+        if waited_pid:
+            break
+        time.sleep(0.01)
+    else:  # pragma: no cover
+        os.kill(pid, 9)
+        os.waitpid(pid, 0)
+        pytest.fail('export hung in the forked child')
+    assert os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0
+    exporter.shutdown()
+
+
+def test_exporters_tracked_weakly() -> None:
+    # Fork handling is registered once for the module, and doesn't keep exporters alive.
+    exporter = ConcurrentSpanExporter(BlockingExporter(), max_inflight=2)
+    assert exporter in _EXPORTERS
+    exporter.shutdown()
+    exporter_ref = weakref.ref(exporter)
+    del exporter
+    gc.collect()
+    assert exporter_ref() is None
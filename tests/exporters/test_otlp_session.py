@@ -20,12 +20,10 @@ class SinkHTTPAdapter(HTTPAdapter):
                 total = len(request.body)
             else:
                 # assume a generator
-                body = request.body
-                for chunk in cast(Iterable[bytes], body):
-                    total += len(chunk)
+                total = sum(map(len, cast(Iterable[bytes], request.body)))
         resp = Response()
         resp.status_code = 200
-        resp._content = f'{total}'.encode()
+        resp._content = b'%d' % total
         return resp
 
 
@@ -42,9 +40,12 @@ def test_max_body_size_generator() -> None:
     s = OTLPExporterHttpSession(max_body_size=10)
     s.mount('http://', SinkHTTPAdapter())
     s.post('http://example.com', data=iter([b'abc'] * 3))
+    body = iter([b'abc'] * 100)
     with pytest.raises(BodyTooLargeError) as e:
-        s.post('http://example.com', data=iter([b'abc'] * 100))
+        s.post('http://example.com', data=body)
     assert str(e.value) == 'Request body is too large (12 bytes), must be less than 10 bytes.'
+    # The rest of the body wasn't consumed.
+    assert len(list(body)) == 96
 
 
 def test_connection_error_retries(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -7,7 +7,8 @@ import sys
 import webbrowser
 from contextlib import ExitStack
 from pathlib import Path
-from unittest.mock import call, patch
+from typing import Iterator
+from unittest.mock import DEFAULT, call, patch
 
 import pytest
 import requests
@@ -21,6 +22,14 @@ from logfire._internal.config import LogfireCredentials, sanitize_project_name
 from logfire.exceptions import LogfireConfigError
 
 
+@pytest.fixture
+def mocked_logfire_api() -> Iterator[requests_mock.Mocker]:
+    """Mock the Logfire API for a logged in user; tests register the endpoints they need on the returned mocker."""
+    with patch('logfire._internal.config.LogfireCredentials._get_user_token', return_value=''):
+        with requests_mock.Mocker() as m:
+            yield m
+
+
 @pytest.fixture
 def logfire_credentials() -> LogfireCredentials:
     return LogfireCredentials(
@@ -188,8 +197,9 @@ def test_inspect_drop_dependant_packages(
 def test_auth(tmp_path: Path, webbrowser_error: bool) -> None:
     auth_file = tmp_path / 'default.toml'
     with ExitStack() as stack:
-        stack.enter_context(patch('logfire._internal.cli.DEFAULT_FILE', auth_file))
-        console = stack.enter_context(patch('logfire._internal.cli.Console'))
+        console = stack.enter_context(patch.multiple('logfire._internal.cli', DEFAULT_FILE=auth_file, Console=DEFAULT))[
+            'Console'
+        ]
         webbrowser_open = stack.enter_context(
             patch('webbrowser.open', side_effect=webbrowser.Error if webbrowser_error is True else None)
         )
@@ -241,8 +251,7 @@ expiration = "fake_exp"
 def test_auth_temp_failure(tmp_path: Path) -> None:
     auth_file = tmp_path / 'default.toml'
     with ExitStack() as stack:
-        stack.enter_context(patch('logfire._internal.cli.DEFAULT_FILE', auth_file))
-        stack.enter_context(patch('logfire._internal.cli.Console'))
+        stack.enter_context(patch.multiple('logfire._internal.cli', DEFAULT_FILE=auth_file, Console=DEFAULT))
         stack.enter_context(patch('logfire._internal.cli.webbrowser.open'))
 
         m = requests_mock.Mocker()
@@ -266,8 +275,7 @@ def test_auth_temp_failure(tmp_path: Path) -> None:
 def test_auth_permanent_failure(tmp_path: Path) -> None:
     auth_file = tmp_path / 'default.toml'
     with ExitStack() as stack:
-        stack.enter_context(patch('logfire._internal.cli.DEFAULT_FILE', auth_file))
-        stack.enter_context(patch('logfire._internal.cli.Console'))
+        stack.enter_context(patch.multiple('logfire._internal.cli', DEFAULT_FILE=auth_file, Console=DEFAULT))
         stack.enter_context(patch('logfire._internal.cli.webbrowser.open'))
 
         m = requests_mock.Mocker()
@@ -284,9 +292,8 @@ def test_auth_permanent_failure(tmp_path: Path) -> None:
 
 
 def test_auth_on_authenticated_user(default_credentials: Path) -> None:
-    with ExitStack() as stack:
-        stack.enter_context(patch('logfire._internal.cli.DEFAULT_FILE', default_credentials))
-        console = stack.enter_context(patch('logfire._internal.cli.Console'))
+    with patch.multiple('logfire._internal.cli', DEFAULT_FILE=default_credentials, Console=DEFAULT) as mocks:
+        console = mocks['Console']
 
         main(['auth'])
 
@@ -302,13 +309,11 @@ def test_projects_help(capsys: pytest.CaptureFixture[str]) -> None:
     assert capsys.readouterr().out.splitlines()[0] == 'usage: logfire projects [-h] {list,new,use} ...'
 
 
-def test_projects_list(default_credentials: Path) -> None:
+def test_projects_list(default_credentials: Path, mocked_logfire_api: requests_mock.Mocker) -> None:
     with ExitStack() as stack:
-        stack.enter_context(patch('logfire._internal.config.LogfireCredentials._get_user_token', return_value=''))
         table_add_row = stack.enter_context(patch('logfire._internal.cli.Table.add_row'))
 
-        m = requests_mock.Mocker()
-        stack.enter_context(m)
+        m = mocked_logfire_api
         m.get(
             'https://logfire-api.pydantic.dev/v1/projects/',
             json=[{'organization_name': 'test-org', 'project_name': 'test-pr'}],
@@ -319,13 +324,11 @@ def test_projects_list(default_credentials: Path) -> None:
         assert "call('test-org', 'test-pr')" == str(table_add_row.mock_calls[0])
 
 
-def test_projects_list_no_project(default_credentials: Path) -> None:
+def test_projects_list_no_project(default_credentials: Path, mocked_logfire_api: requests_mock.Mocker) -> None:
     with ExitStack() as stack:
-        stack.enter_context(patch('logfire._internal.config.LogfireCredentials._get_user_token', return_value=''))
         console = stack.enter_context(patch('logfire._internal.cli.Console'))
 
-        m = requests_mock.Mocker()
-        stack.enter_context(m)
+        m = mocked_logfire_api
         m.get('https://logfire-api.pydantic.dev/v1/projects/', json=[])
 
         main(['projects', 'list'])
@@ -337,13 +340,13 @@ def test_projects_list_no_project(default_credentials: Path) -> None:
         ]
 
 
-def test_projects_new_with_project_name_and_org(tmp_dir_cwd: Path, default_credentials: Path) -> None:
+def test_projects_new_with_project_name_and_org(
+    tmp_dir_cwd: Path, default_credentials: Path, mocked_logfire_api: requests_mock.Mocker
+) -> None:
     with ExitStack() as stack:
-        stack.enter_context(patch('logfire._internal.config.LogfireCredentials._get_user_token', return_value=''))
         console = stack.enter_context(patch('logfire._internal.cli.Console'))
 
-        m = requests_mock.Mocker()
-        stack.enter_context(m)
+        m = mocked_logfire_api
         m.get('https://logfire-api.pydantic.dev/v1/projects/', json=[])
         m.get('https://logfire-api.pydantic.dev/v1/organizations/', json=[{'organization_name': 'fake_org'}])
         create_project_response = {
@@ -372,14 +375,14 @@ def test_projects_new_with_project_name_and_org(tmp_dir_cwd: Path, default_crede
         }
 
 
-def test_projects_new_with_project_name_without_org(tmp_dir_cwd: Path, default_credentials: Path) -> None:
+def test_projects_new_with_project_name_without_org(
+    tmp_dir_cwd: Path, default_credentials: Path, mocked_logfire_api: requests_mock.Mocker
+) -> None:
     with ExitStack() as stack:
-        stack.enter_context(patch('logfire._internal.config.LogfireCredentials._get_user_token', return_value=''))
         console = stack.enter_context(patch('logfire._internal.cli.Console'))
         confirm_mock = stack.enter_context(patch('rich.prompt.Confirm.ask', side_effect=[True]))
 
-        m = requests_mock.Mocker()
-        stack.enter_context(m)
+        m = mocked_logfire_api
         m.get('https://logfire-api.pydantic.dev/v1/projects/', json=[])
         m.get('https://logfire-api.pydantic.dev/v1/organizations/', json=[{'organization_name': 'fake_org'}])
         create_project_response = {
@@ -412,14 +415,14 @@ def test_projects_new_with_project_name_without_org(tmp_dir_cwd: Path, default_c
         }
 
 
-def test_projects_new_with_project_name_and_wrong_org(tmp_dir_cwd: Path, default_credentials: Path) -> None:
+def test_projects_new_with_project_name_and_wrong_org(
+    tmp_dir_cwd: Path, default_credentials: Path, mocked_logfire_api: requests_mock.Mocker
+) -> None:
     with ExitStack() as stack:
-        stack.enter_context(patch('logfire._internal.config.LogfireCredentials._get_user_token', return_value=''))
         console = stack.enter_context(patch('logfire._internal.cli.Console'))
         confirm_mock = stack.enter_context(patch('rich.prompt.Confirm.ask', side_effect=[True]))
 
-        m = requests_mock.Mocker()
-        stack.enter_context(m)
+        m = mocked_logfire_api
         m.get('https://logfire-api.pydantic.dev/v1/projects/', json=[])
         m.get('https://logfire-api.pydantic.dev/v1/organizations/', json=[{'organization_name': 'fake_org'}])
         create_project_response = {
@@ -452,13 +455,13 @@ def test_projects_new_with_project_name_and_wrong_org(tmp_dir_cwd: Path, default
         }
 
 
-def test_projects_new_with_project_name_and_default_org(tmp_dir_cwd: Path, default_credentials: Path) -> None:
+def test_projects_new_with_project_name_and_default_org(
+    tmp_dir_cwd: Path, default_credentials: Path, mocked_logfire_api: requests_mock.Mocker
+) -> None:
     with ExitStack() as stack:
-        stack.enter_context(patch('logfire._internal.config.LogfireCredentials._get_user_token', return_value=''))
         console = stack.enter_context(patch('logfire._internal.cli.Console'))
 
-        m = requests_mock.Mocker()
-        stack.enter_context(m)
+        m = mocked_logfire_api
         m.get('https://logfire-api.pydantic.dev/v1/projects/', json=[])
         m.get('https://logfire-api.pydantic.dev/v1/organizations/', json=[{'organization_name': 'fake_org'}])
         create_project_response = {
@@ -487,14 +490,14 @@ def test_projects_new_with_project_name_and_default_org(tmp_dir_cwd: Path, defau
         }
 
 
-def test_projects_new_with_project_name_multiple_organizations(tmp_dir_cwd: Path, default_credentials: Path) -> None:
+def test_projects_new_with_project_name_multiple_organizations(
+    tmp_dir_cwd: Path, default_credentials: Path, mocked_logfire_api: requests_mock.Mocker
+) -> None:
     with ExitStack() as stack:
-        stack.enter_context(patch('logfire._internal.config.LogfireCredentials._get_user_token', return_value=''))
         console = stack.enter_context(patch('logfire._internal.cli.Console'))
         prompt_mock = stack.enter_context(patch('rich.prompt.Prompt.ask', side_effect=['fake_org']))
 
-        m = requests_mock.Mocker()
-        stack.enter_context(m)
+        m = mocked_logfire_api
         m.get('https://logfire-api.pydantic.dev/v1/projects/', json=[])
         m.get(
             'https://logfire-api.pydantic.dev/v1/organizations/',
@@ -540,14 +543,12 @@ def test_projects_new_with_project_name_multiple_organizations(tmp_dir_cwd: Path
 
 
 def test_projects_new_with_project_name_and_default_org_multiple_organizations(
-    tmp_dir_cwd: Path, default_credentials: Path
+    tmp_dir_cwd: Path, default_credentials: Path, mocked_logfire_api: requests_mock.Mocker
 ) -> None:
     with ExitStack() as stack:
-        stack.enter_context(patch('logfire._internal.config.LogfireCredentials._get_user_token', return_value=''))
         console = stack.enter_context(patch('logfire._internal.cli.Console'))
 
-        m = requests_mock.Mocker()
-        stack.enter_context(m)
+        m = mocked_logfire_api
         m.get('https://logfire-api.pydantic.dev/v1/projects/', json=[])
         m.get(
             'https://logfire-api.pydantic.dev/v1/organizations/',
@@ -584,14 +585,14 @@ def test_projects_new_with_project_name_and_default_org_multiple_organizations(
         }
 
 
-def test_projects_new_without_project_name(tmp_dir_cwd: Path, default_credentials: Path) -> None:
+def test_projects_new_without_project_name(
+    tmp_dir_cwd: Path, default_credentials: Path, mocked_logfire_api: requests_mock.Mocker
+) -> None:
     with ExitStack() as stack:
-        stack.enter_context(patch('logfire._internal.config.LogfireCredentials._get_user_token', return_value=''))
         console = stack.enter_context(patch('logfire._internal.cli.Console'))
         prompt_mock = stack.enter_context(patch('rich.prompt.Prompt.ask', side_effect=['myproject', '']))
 
-        m = requests_mock.Mocker()
-        stack.enter_context(m)
+        m = mocked_logfire_api
         m.get('https://logfire-api.pydantic.dev/v1/projects/', json=[])
         m.get('https://logfire-api.pydantic.dev/v1/organizations/', json=[{'organization_name': 'fake_org'}])
         create_project_response = {
@@ -623,14 +624,14 @@ def test_projects_new_without_project_name(tmp_dir_cwd: Path, default_credential
         }
 
 
-def test_projects_new_invalid_project_name(tmp_dir_cwd: Path, default_credentials: Path) -> None:
+def test_projects_new_invalid_project_name(
+    tmp_dir_cwd: Path, default_credentials: Path, mocked_logfire_api: requests_mock.Mocker
+) -> None:
     with ExitStack() as stack:
-        stack.enter_context(patch('logfire._internal.config.LogfireCredentials._get_user_token', return_value=''))
         console = stack.enter_context(patch('logfire._internal.cli.Console'))
         prompt_mock = stack.enter_context(patch('rich.prompt.Prompt.ask', side_effect=['myproject', '']))
 
-        m = requests_mock.Mocker()
-        stack.enter_context(m)
+        m = mocked_logfire_api
         m.get('https://logfire-api.pydantic.dev/v1/projects/', json=[])
         m.get('https://logfire-api.pydantic.dev/v1/organizations/', json=[{'organization_name': 'fake_org'}])
         create_project_response = {
@@ -669,14 +670,14 @@ def test_projects_new_invalid_project_name(tmp_dir_cwd: Path, default_credential
         }
 
 
-def test_projects_new_error(tmp_dir_cwd: Path, default_credentials: Path) -> None:
+def test_projects_new_error(
+    tmp_dir_cwd: Path, default_credentials: Path, mocked_logfire_api: requests_mock.Mocker
+) -> None:
     with ExitStack() as stack:
-        stack.enter_context(patch('logfire._internal.config.LogfireCredentials._get_user_token', return_value=''))
         stack.enter_context(patch('logfire._internal.cli.Console'))
         stack.enter_context(patch('logfire._internal.cli.LogfireCredentials.write_creds_file', side_effect=TypeError))
 
-        m = requests_mock.Mocker()
-        stack.enter_context(m)
+        m = mocked_logfire_api
         m.get('https://logfire-api.pydantic.dev/v1/projects/', json=[])
         m.get('https://logfire-api.pydantic.dev/v1/organizations/', json=[{'organization_name': 'fake_org'}])
         create_project_response = {
@@ -695,15 +696,15 @@ def test_projects_new_error(tmp_dir_cwd: Path, default_credentials: Path) -> Non
             main(['projects', 'new', 'myproject', '--org', 'fake_org'])
 
 
-def test_projects_without_project_name_without_org(tmp_dir_cwd: Path, default_credentials: Path) -> None:
+def test_projects_without_project_name_without_org(
+    tmp_dir_cwd: Path, default_credentials: Path, mocked_logfire_api: requests_mock.Mocker
+) -> None:
     with ExitStack() as stack:
-        stack.enter_context(patch('logfire._internal.config.LogfireCredentials._get_user_token', return_value=''))
         console = stack.enter_context(patch('logfire._internal.cli.Console'))
         confirm_mock = stack.enter_context(patch('rich.prompt.Confirm.ask', side_effect=[True]))
         prompt_mock = stack.enter_context(patch('rich.prompt.Prompt.ask', side_effect=['myproject', '']))
 
-        m = requests_mock.Mocker()
-        stack.enter_context(m)
+        m = mocked_logfire_api
         m.get('https://logfire-api.pydantic.dev/v1/projects/', json=[])
         m.get('https://logfire-api.pydantic.dev/v1/organizations/', json=[{'organization_name': 'fake_org'}])
         create_project_response = {
@@ -738,43 +739,39 @@ def test_projects_without_project_name_without_org(tmp_dir_cwd: Path, default_cr
         }
 
 
-def test_projects_new_get_organizations_error(tmp_dir_cwd: Path, default_credentials: Path) -> None:
-    with ExitStack() as stack:
-        stack.enter_context(patch('logfire._internal.config.LogfireCredentials._get_user_token', return_value=''))
-
-        m = requests_mock.Mocker()
-        stack.enter_context(m)
-        m.get('https://logfire-api.pydantic.dev/v1/organizations/', text='Error', status_code=500)
-
-        with pytest.raises(LogfireConfigError, match='Error retrieving list of organizations.'):
-            main(['projects', 'new'])
+def test_projects_new_get_organizations_error(
+    tmp_dir_cwd: Path, default_credentials: Path, mocked_logfire_api: requests_mock.Mocker
+) -> None:
+    m = mocked_logfire_api
+    m.get('https://logfire-api.pydantic.dev/v1/organizations/', text='Error', status_code=500)
 
+    with pytest.raises(LogfireConfigError, match='Error retrieving list of organizations.'):
+        main(['projects', 'new'])
 
-def test_projects_new_get_user_info_error(tmp_dir_cwd: Path, default_credentials: Path) -> None:
-    with ExitStack() as stack:
-        stack.enter_context(patch('logfire._internal.config.LogfireCredentials._get_user_token', return_value=''))
 
-        m = requests_mock.Mocker()
-        stack.enter_context(m)
-        m.get('https://logfire-api.pydantic.dev/v1/projects/', json=[])
-        m.get(
-            'https://logfire-api.pydantic.dev/v1/organizations/',
-            json=[{'organization_name': 'fake_org'}, {'organization_name': 'fake_default_org'}],
-        )
-        m.get('https://logfire-api.pydantic.dev/v1/account/me', text='Error', status_code=500)
+def test_projects_new_get_user_info_error(
+    tmp_dir_cwd: Path, default_credentials: Path, mocked_logfire_api: requests_mock.Mocker
+) -> None:
+    m = mocked_logfire_api
+    m.get('https://logfire-api.pydantic.dev/v1/projects/', json=[])
+    m.get(
+        'https://logfire-api.pydantic.dev/v1/organizations/',
+        json=[{'organization_name': 'fake_org'}, {'organization_name': 'fake_default_org'}],
+    )
+    m.get('https://logfire-api.pydantic.dev/v1/account/me', text='Error', status_code=500)
 
-        with pytest.raises(LogfireConfigError, match='Error retrieving user information.'):
-            main(['projects', 'new'])
+    with pytest.raises(LogfireConfigError, match='Error retrieving user information.'):
+        main(['projects', 'new'])
 
 
-def test_projects_new_create_project_error(tmp_dir_cwd: Path, default_credentials: Path) -> None:
+def test_projects_new_create_project_error(
+    tmp_dir_cwd: Path, default_credentials: Path, mocked_logfire_api: requests_mock.Mocker
+) -> None:
     with ExitStack() as stack:
-        stack.enter_context(patch('logfire._internal.config.LogfireCredentials._get_user_token', return_value=''))
         stack.enter_context(patch('logfire._internal.cli.Console'))
         stack.enter_context(patch('logfire._internal.cli.LogfireCredentials.write_creds_file', side_effect=TypeError))
 
-        m = requests_mock.Mocker()
-        stack.enter_context(m)
+        m = mocked_logfire_api
         m.get('https://logfire-api.pydantic.dev/v1/projects/', json=[])
         m.get('https://logfire-api.pydantic.dev/v1/organizations/', json=[{'organization_name': 'fake_org'}])
         m.post('https://logfire-api.pydantic.dev/v1/projects/fake_org', text='Error', status_code=500)
@@ -783,13 +780,11 @@ def test_projects_new_create_project_error(tmp_dir_cwd: Path, default_credential
             main(['projects', 'new', 'myproject', '--org', 'fake_org'])
 
 
-def test_projects_use(tmp_dir_cwd: Path, default_credentials: Path) -> None:
+def test_projects_use(tmp_dir_cwd: Path, default_credentials: Path, mocked_logfire_api: requests_mock.Mocker) -> None:
     with ExitStack() as stack:
-        stack.enter_context(patch('logfire._internal.config.LogfireCredentials._get_user_token', return_value=''))
         console = stack.enter_context(patch('logfire._internal.cli.Console'))
 
-        m = requests_mock.Mocker()
-        stack.enter_context(m)
+        m = mocked_logfire_api
         m.get(
             'https://logfire-api.pydantic.dev/v1/projects/',
             json=[
@@ -823,14 +818,14 @@ def test_projects_use(tmp_dir_cwd: Path, default_credentials: Path) -> None:
         }
 
 
-def test_projects_use_without_project_name(tmp_dir_cwd: Path, default_credentials: Path) -> None:
+def test_projects_use_without_project_name(
+    tmp_dir_cwd: Path, default_credentials: Path, mocked_logfire_api: requests_mock.Mocker
+) -> None:
     with ExitStack() as stack:
-        stack.enter_context(patch('logfire._internal.config.LogfireCredentials._get_user_token', return_value=''))
         console = stack.enter_context(patch('logfire._internal.cli.Console'))
         prompt_mock = stack.enter_context(patch('rich.prompt.Prompt.ask', side_effect=['1']))
 
-        m = requests_mock.Mocker()
-        stack.enter_context(m)
+        m = mocked_logfire_api
         m.get(
             'https://logfire-api.pydantic.dev/v1/projects/',
             json=[
@@ -876,15 +871,15 @@ def test_projects_use_without_project_name(tmp_dir_cwd: Path, default_credential
         }
 
 
-def test_projects_use_multiple(tmp_dir_cwd: Path, default_credentials: Path) -> None:
+def test_projects_use_multiple(
+    tmp_dir_cwd: Path, default_credentials: Path, mocked_logfire_api: requests_mock.Mocker
+) -> None:
     with ExitStack() as stack:
-        stack.enter_context(patch('logfire._internal.config.LogfireCredentials._get_user_token', return_value=''))
         console = stack.enter_context(patch('logfire._internal.cli.Console'))
         config_console = stack.enter_context(patch('logfire._internal.config.Console'))
         prompt_mock = stack.enter_context(patch('rich.prompt.Prompt.ask', side_effect=['1']))
 
-        m = requests_mock.Mocker()
-        stack.enter_context(m)
+        m = mocked_logfire_api
         m.get(
             'https://logfire-api.pydantic.dev/v1/projects/',
             json=[
@@ -936,13 +931,13 @@ def test_projects_use_multiple(tmp_dir_cwd: Path, default_credentials: Path) ->
         }
 
 
-def test_projects_use_multiple_with_org(tmp_dir_cwd: Path, default_credentials: Path) -> None:
+def test_projects_use_multiple_with_org(
+    tmp_dir_cwd: Path, default_credentials: Path, mocked_logfire_api: requests_mock.Mocker
+) -> None:
     with ExitStack() as stack:
-        stack.enter_context(patch('logfire._internal.config.LogfireCredentials._get_user_token', return_value=''))
         console = stack.enter_context(patch('logfire._internal.cli.Console'))
 
-        m = requests_mock.Mocker()
-        stack.enter_context(m)
+        m = mocked_logfire_api
         m.get(
             'https://logfire-api.pydantic.dev/v1/projects/',
             json=[
@@ -976,14 +971,14 @@ def test_projects_use_multiple_with_org(tmp_dir_cwd: Path, default_credentials:
         }
 
 
-def test_projects_use_wrong_project(tmp_dir_cwd: Path, default_credentials: Path) -> None:
+def test_projects_use_wrong_project(
+    tmp_dir_cwd: Path, default_credentials: Path, mocked_logfire_api: requests_mock.Mocker
+) -> None:
     with ExitStack() as stack:
-        stack.enter_context(patch('logfire._internal.config.LogfireCredentials._get_user_token', return_value=''))
         console = stack.enter_context(patch('logfire._internal.cli.Console'))
         prompt_mock = stack.enter_context(patch('rich.prompt.Prompt.ask', side_effect=['y', '1']))
 
-        m = requests_mock.Mocker()
-        stack.enter_context(m)
+        m = mocked_logfire_api
         m.get(
             'https://logfire-api.pydantic.dev/v1/projects/',
             json=[{'organization_name': 'fake_org', 'project_name': 'myproject'}],
@@ -1026,15 +1021,15 @@ def test_projects_use_wrong_project(tmp_dir_cwd: Path, default_credentials: Path
         }
 
 
-def test_projects_use_wrong_project_give_up(tmp_dir_cwd: Path, default_credentials: Path) -> None:
+def test_projects_use_wrong_project_give_up(
+    tmp_dir_cwd: Path, default_credentials: Path, mocked_logfire_api: requests_mock.Mocker
+) -> None:
     with ExitStack() as stack:
-        stack.enter_context(patch('logfire._internal.config.LogfireCredentials._get_user_token', return_value=''))
         console = stack.enter_context(patch('logfire._internal.cli.Console'))
         config_console = stack.enter_context(patch('logfire._internal.config.Console'))
         prompt_mock = stack.enter_context(patch('rich.prompt.Prompt.ask', side_effect=['n']))
 
-        m = requests_mock.Mocker()
-        stack.enter_context(m)
+        m = mocked_logfire_api
         m.get(
             'https://logfire-api.pydantic.dev/v1/projects/',
             json=[{'organization_name': 'fake_org', 'project_name': 'myproject'}],
@@ -1060,33 +1055,31 @@ def test_projects_use_wrong_project_give_up(tmp_dir_cwd: Path, default_credentia
         ]
 
 
-def test_projects_use_without_projects(tmp_dir_cwd: Path, capsys: pytest.CaptureFixture[str]) -> None:
-    with ExitStack() as stack:
-        stack.enter_context(patch('logfire._internal.config.LogfireCredentials._get_user_token', return_value=''))
-
-        m = requests_mock.Mocker()
-        stack.enter_context(m)
-        m.get(
-            'https://logfire-api.pydantic.dev/v1/projects/',
-            json=[],
-        )
+def test_projects_use_without_projects(
+    tmp_dir_cwd: Path, capsys: pytest.CaptureFixture[str], mocked_logfire_api: requests_mock.Mocker
+) -> None:
+    m = mocked_logfire_api
+    m.get(
+        'https://logfire-api.pydantic.dev/v1/projects/',
+        json=[],
+    )
 
-        main(['projects', 'use', 'myproject'])
+    main(['projects', 'use', 'myproject'])
 
-        assert (
-            re.sub(r'\s+', ' ', capsys.readouterr().err).strip()
-            == 'No projects found for the current user. You can create a new project with `logfire projects new`'
-        )
+    assert (
+        re.sub(r'\s+', ' ', capsys.readouterr().err).strip()
+        == 'No projects found for the current user. You can create a new project with `logfire projects new`'
+    )
 
 
-def test_projects_use_error(tmp_dir_cwd: Path, default_credentials: Path) -> None:
+def test_projects_use_error(
+    tmp_dir_cwd: Path, default_credentials: Path, mocked_logfire_api: requests_mock.Mocker
+) -> None:
     with ExitStack() as stack:
-        stack.enter_context(patch('logfire._internal.config.LogfireCredentials._get_user_token', return_value=''))
         stack.enter_context(patch('logfire._internal.cli.Console'))
         stack.enter_context(patch('logfire._internal.cli.LogfireCredentials.write_creds_file', side_effect=TypeError))
 
-        m = requests_mock.Mocker()
-        stack.enter_context(m)
+        m = mocked_logfire_api
         m.get(
             'https://logfire-api.pydantic.dev/v1/projects/',
             json=[{'organization_name': 'fake_org', 'project_name': 'myproject'}],
@@ -1107,14 +1100,14 @@ def test_projects_use_error(tmp_dir_cwd: Path, default_credentials: Path) -> Non
             main(['projects', 'use', 'myproject', '--org', 'fake_org'])
 
 
-def test_projects_use_write_token_error(tmp_dir_cwd: Path, default_credentials: Path) -> None:
+def test_projects_use_write_token_error(
+    tmp_dir_cwd: Path, default_credentials: Path, mocked_logfire_api: requests_mock.Mocker
+) -> None:
     with ExitStack() as stack:
-        stack.enter_context(patch('logfire._internal.config.LogfireCredentials._get_user_token', return_value=''))
         stack.enter_context(patch('logfire._internal.cli.Console'))
         stack.enter_context(patch('logfire._internal.cli.LogfireCredentials.write_creds_file', side_effect=TypeError))
 
-        m = requests_mock.Mocker()
-        stack.enter_context(m)
+        m = mocked_logfire_api
         m.get(
             'https://logfire-api.pydantic.dev/v1/projects/',
             json=[{'organization_name': 'fake_org', 'project_name': 'myproject'}],
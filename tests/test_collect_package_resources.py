@@ -3,6 +3,7 @@ import json
 from dirty_equals import IsPartialDict
 
 from logfire import VERSION, info
+from logfire._internal.collect_system_info import collect_package_info, collect_package_info_json
 from logfire.testing import TestExporter
 
 
@@ -19,3 +20,9 @@ def test_collect_resources(exporter: TestExporter) -> None:
     data = json.loads(resource['attributes']['logfire.package_versions'])
 
     assert data == IsPartialDict({'logfire': VERSION})
+
+
+def test_collect_package_info_json_cached() -> None:
+    package_info_json = collect_package_info_json()
+    assert json.loads(package_info_json) == collect_package_info()
+    assert collect_package_info_json() is package_info_json
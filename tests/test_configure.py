@@ -11,11 +11,12 @@ from unittest import mock
 from unittest.mock import call, patch
 
 import pytest
+import requests
 import requests_mock
 from inline_snapshot import snapshot
 from opentelemetry.sdk.metrics.export import InMemoryMetricReader
 from opentelemetry.sdk.trace import ReadableSpan
-from opentelemetry.sdk.trace.export import SimpleSpanProcessor, SpanExporter, SpanExportResult
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, SimpleSpanProcessor, SpanExporter, SpanExportResult
 from pytest import LogCaptureFixture
 
 import logfire
@@ -27,10 +28,13 @@ from logfire._internal.config import (
     LogfireCredentials,
     sanitize_project_name,
 )
+from logfire._internal.config_params import get_int_from_env
+from logfire._internal.exporters.concurrent import ConcurrentSpanExporter
 from logfire._internal.exporters.fallback import FallbackSpanExporter
 from logfire._internal.exporters.file import WritingFallbackWarning
 from logfire._internal.exporters.wrapper import WrapperSpanExporter
 from logfire._internal.integrations.executors import deserialize_config, serialize_config
+from logfire._internal.utils import read_toml_file
 from logfire.exceptions import LogfireConfigError
 from logfire.testing import IncrementalIdGenerator, TestExporter, TimeGenerator
 
@@ -469,6 +473,19 @@ def test_read_config_from_pyproject_toml(tmp_path: Path) -> None:
     assert GLOBAL_CONFIG.pydantic_plugin.exclude == {'test3', 'test4'}
 
 
+def test_read_config_from_pyproject_toml_cached(tmp_path: Path) -> None:
+    config_file = tmp_path / 'pyproject.toml'
+    config_file.write_text('[tool.logfire]\nproject_name = "first"\n')
+    with patch('logfire._internal.config_params.read_toml_file', wraps=read_toml_file) as read_toml_file_mock:
+        assert LogfireConfig(config_dir=tmp_path).project_name == 'first'
+        assert LogfireConfig(config_dir=tmp_path).project_name == 'first'
+        assert read_toml_file_mock.call_count == 1
+
+        config_file.write_text('[tool.logfire]\nproject_name = "second-one"\n')
+        assert LogfireConfig(config_dir=tmp_path).project_name == 'second-one'
+        assert read_toml_file_mock.call_count == 2
+
+
 def test_logfire_invalid_config_dir(tmp_path: Path):
     (tmp_path / 'pyproject.toml').write_text('invalid-data')
     with pytest.raises(
@@ -1230,6 +1247,37 @@ def test_load_creds_file_legacy_key(tmp_path: Path):
     assert cred and cred.project_url == 'http://dash.localhost:8000/test'
 
 
+def test_load_creds_file_cached(tmp_path: Path):
+    credentials = LogfireCredentials(
+        token='test', project_name='test', project_url='http://dash.localhost:8000/test', logfire_api_url='url'
+    )
+    credentials.write_creds_file(tmp_path)
+
+    with patch('logfire._internal.config.json.load', wraps=json.load) as json_load_mock:
+        loaded = LogfireCredentials.load_creds_file(creds_dir=tmp_path)
+        assert loaded == credentials
+        # Changes to a loaded instance don't affect later loads.
+        assert loaded is not None
+        loaded.project_name = 'mutated'
+        assert LogfireCredentials.load_creds_file(creds_dir=tmp_path) == credentials
+        assert json_load_mock.call_count == 1
+
+        credentials.project_name = 'test-changed'
+        credentials.write_creds_file(tmp_path)
+        assert LogfireCredentials.load_creds_file(creds_dir=tmp_path) == credentials
+        assert json_load_mock.call_count == 2
+
+        # A rewrite with the same size and mtime, e.g. a quick token refresh, isn't hidden by the cache.
+        creds_file = tmp_path / 'logfire_credentials.json'
+        stat = creds_file.stat()
+        credentials.token = 'tset'
+        credentials.write_creds_file(tmp_path)
+        os.utime(creds_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert creds_file.stat().st_size == stat.st_size
+        assert LogfireCredentials.load_creds_file(creds_dir=tmp_path) == credentials
+        assert json_load_mock.call_count == 3
+
+
 def test_load_creds_file_invalid_key(tmp_path: Path):
     creds_file = tmp_path / 'logfire_credentials.json'
     creds_file.write_text('{"test": "test"}')
@@ -1298,3 +1346,192 @@ def test_configure_fstring_python_38():
         match=r'Inspecting arguments is only supported in Python 3.9\+ and only recommended in Python 3.11\+.',
     ):
         logfire.configure(send_to_logfire=False, inspect_arguments=True)
+
+
+def test_env_cache_cleared_on_reconfigure() -> None:
+    with patch.dict(os.environ, {'OTEL_BSP_SCHEDULE_DELAY': '1000'}):
+        LogfireConfig()
+        assert get_int_from_env('OTEL_BSP_SCHEDULE_DELAY') == 1000
+
+        # The cached value is used until the configuration is reloaded.
+        os.environ['OTEL_BSP_SCHEDULE_DELAY'] = '2000'
+        assert get_int_from_env('OTEL_BSP_SCHEDULE_DELAY') == 1000
+
+        LogfireConfig()
+        assert get_int_from_env('OTEL_BSP_SCHEDULE_DELAY') == 2000
+
+
+def test_default_span_processor_env_vars() -> None:
+    with patch.dict(
+        os.environ,
+        {
+            'OTEL_BSP_SCHEDULE_DELAY': '1000',
+            'OTEL_BSP_MAX_QUEUE_SIZE': '4096',
+            'OTEL_BSP_MAX_EXPORT_BATCH_SIZE': '1024',
+            'OTEL_BSP_EXPORT_TIMEOUT': '10000',
+        },
+    ):
+        processor = LogfireConfig().default_span_processor(TestExporter())
+    try:
+        assert isinstance(processor, BatchSpanProcessor)
+        assert processor.schedule_delay_millis == 1000
+        assert processor.max_queue_size == 4096
+        assert processor.max_export_batch_size == 1024
+        assert processor.export_timeout_millis == 10000
+    finally:
+        processor.shutdown()
+
+
+def test_default_span_processor_invalid_env_vars() -> None:
+    with patch.dict(
+        os.environ,
+        {
+            'OTEL_BSP_SCHEDULE_DELAY': 'soon',
+            'OTEL_BSP_MAX_QUEUE_SIZE': 'lots',
+            'OTEL_BSP_MAX_EXPORT_BATCH_SIZE': '',
+            'OTEL_BSP_EXPORT_TIMEOUT': '30s',
+        },
+    ):
+        processor = LogfireConfig().default_span_processor(TestExporter())
+    try:
+        assert isinstance(processor, BatchSpanProcessor)
+        assert processor.schedule_delay_millis == 500
+        assert processor.max_queue_size == 2048
+        assert processor.max_export_batch_size == 512
+        assert processor.export_timeout_millis == 30000
+    finally:
+        processor.shutdown()
+
+
+def test_configure_export_concurrency(tmp_path: Path) -> None:
+    exporters: list[SpanExporter] = []
+
+    def default_span_processor(exporter: SpanExporter) -> SimpleSpanProcessor:
+        exporters.append(exporter)
+        return SimpleSpanProcessor(TestExporter())
+
+    with requests_mock.Mocker() as request_mocker:
+        request_mocker.get(
+            'https://logfire-api.pydantic.dev/v1/info',
+            json={'project_name': 'myproject', 'project_url': 'fake_project_url'},
+        )
+        for export_concurrency in [None, 3]:
+            logfire.configure(
+                send_to_logfire=True,
+                data_dir=tmp_path,
+                token='abc',
+                default_span_processor=default_span_processor,
+                additional_metric_readers=[InMemoryMetricReader()],
+                export_concurrency=export_concurrency,
+            )
+
+    assert GLOBAL_CONFIG.export_concurrency == 3
+    serial_exporter, concurrent_exporter = exporters
+    assert isinstance(serial_exporter, WrapperSpanExporter)
+    assert isinstance(concurrent_exporter, WrapperSpanExporter)
+    assert isinstance(serial_exporter.wrapped_exporter, FallbackSpanExporter)
+    assert isinstance(concurrent_exporter.wrapped_exporter, ConcurrentSpanExporter)
+    concurrent_exporter.shutdown()
+
+
+@pytest.mark.parametrize('export_concurrency', [0, -1])
+def test_invalid_export_concurrency(export_concurrency: int) -> None:
+    with pytest.raises(LogfireConfigError, match=f'`export_concurrency` must be at least 1, got {export_concurrency}.'):
+        configure(send_to_logfire=False, console=False, export_concurrency=export_concurrency)
+
+
+def test_default_logfire_api_session_is_shared() -> None:
+    session = LogfireConfig().logfire_api_session
+    assert LogfireConfig().logfire_api_session is session
+
+    with requests_mock.Mocker() as request_mocker:
+        request_mocker.get(
+            'https://logfire-api.pydantic.dev/v1/info',
+            json={'project_name': 'myproject', 'project_url': 'fake_project_url'},
+        )
+        configure(token='abc', console=False, collect_system_metrics=False)
+
+    assert GLOBAL_CONFIG.logfire_api_session is session
+    # The token must not leak into other configurations using the shared session.
+    assert 'Authorization' not in session.headers
+
+    custom_session = requests.Session()
+    assert LogfireConfig(logfire_api_session=custom_session).logfire_api_session is custom_session
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='requires os.fork')
+def test_default_logfire_api_session_reset_after_fork() -> None:
+    session = LogfireConfig().logfire_api_session
+
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover
+        # The child must not share the parent's pooled connections.
+        new_session = LogfireConfig().logfire_api_session
+        os._exit(0 if new_session is not session and LogfireConfig().logfire_api_session is new_session else 1)  # type: ignore
+
+    _, status = os.waitpid(pid, 0)
+    assert os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0
+    assert LogfireConfig().logfire_api_session is session
+
+
+def test_initialize_twice() -> None:
+    logfire.configure(send_to_logfire=False, console=False)
+    tracer_provider = GLOBAL_CONFIG.get_tracer_provider()
+    sdk_tracer_provider = tracer_provider.provider
+
+    with patch('logfire._internal.config.SDKTracerProvider') as sdk_tracer_provider_cls:
+        assert GLOBAL_CONFIG.initialize() is tracer_provider
+        assert not sdk_tracer_provider_cls.called
+    assert tracer_provider.provider is sdk_tracer_provider
+
+    # Reconfiguring does set up a new provider.
+    logfire.configure(send_to_logfire=False, console=False)
+    assert tracer_provider.provider is not sdk_tracer_provider
+
+
+def test_configure_str_paths(tmp_path: Path) -> None:
+    (tmp_path / 'pyproject.toml').write_text('[tool.logfire]\nproject_name = "from-file"\n')
+    logfire.configure(send_to_logfire=False, config_dir=str(tmp_path), data_dir=str(tmp_path / 'data'))
+    assert GLOBAL_CONFIG.project_name == 'from-file'
+    assert GLOBAL_CONFIG.data_dir == tmp_path / 'data'
+
+    logfire.configure(send_to_logfire=False, data_dir='')
+    assert GLOBAL_CONFIG.data_dir == Path('.logfire')
+
+
+def test_print_summary_force_color(capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch) -> None:
+    credentials = LogfireCredentials(
+        token='token', project_name='my-project', project_url='fake_project_url', logfire_api_url='fake_url'
+    )
+    credentials.print_token_summary()
+    assert capsys.readouterr().err == 'Logfire project URL: fake_project_url\n'
+
+    # With FORCE_COLOR set, the summary is rendered with rich even though stderr isn't a terminal.
+    monkeypatch.setenv('FORCE_COLOR', '1')
+    credentials.print_token_summary()
+    err = capsys.readouterr().err
+    assert '\x1b[' in err
+    assert 'fake_project_url' in err
+
+
+def test_print_summary_jupyter(capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch) -> None:
+    credentials = LogfireCredentials(
+        token='token', project_name='my-project', project_url='fake_project_url', logfire_api_url='fake_url'
+    )
+    # In a notebook stderr isn't a TTY, but the summary should still go through rich rather than the plain text path.
+    monkeypatch.setattr('logfire._internal.config._is_jupyter', lambda: True)
+    with patch('logfire._internal.config._summary_console') as summary_console:
+        credentials.print_token_summary()
+    summary_console.return_value.print.assert_called_once()
+    assert capsys.readouterr().err == ''
+
+
+def test_print_summary_no_stderr(monkeypatch: pytest.MonkeyPatch) -> None:
+    credentials = LogfireCredentials(
+        token='token', project_name='my-project', project_url='fake_project_url', logfire_api_url='fake_url'
+    )
+    # e.g. under pythonw there's no stderr at all, which rich copes with.
+    monkeypatch.setattr(sys, 'stderr', None)
+    with patch('logfire._internal.config._summary_console') as summary_console:
+        credentials.print_token_summary()
+    summary_console.return_value.print.assert_called_once()
@@ -3,7 +3,7 @@ from typing import Any, Mapping
 
 from inline_snapshot import snapshot
 
-from logfire._internal.formatter import chunks_formatter, logfire_format
+from logfire._internal.formatter import _parse_format_string_cached, chunks_formatter, logfire_format  # type: ignore
 from logfire._internal.scrubbing import Scrubber
 
 
@@ -81,3 +81,18 @@ def test_truncate():
         ' 3'
     )
     assert len(message) == snapshot(261)
+
+
+def test_plain_message():
+    assert logfire_format('no fields here', {'bar': 42}, Scrubber([])) == 'no fields here'
+    assert logfire_format('escaped {{braces}}', {}, Scrubber([])) == 'escaped {braces}'
+
+
+def test_long_format_string_not_cached():
+    _parse_format_string_cached.cache_clear()
+    long_template = '{foo} ' + 'x' * 1000
+    assert logfire_format(long_template, {'foo': 1}, Scrubber([])) == '1 ' + 'x' * 1000
+    assert _parse_format_string_cached.cache_info().currsize == 0
+
+    assert logfire_format('{foo}', {'foo': 1}, Scrubber([])) == '1'
+    assert _parse_format_string_cached.cache_info().currsize == 1
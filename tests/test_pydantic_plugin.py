@@ -22,7 +22,7 @@ from typing_extensions import Annotated
 import logfire
 from logfire._internal.config import GLOBAL_CONFIG, PydanticPlugin
 from logfire._internal.config_params import default_param_manager
-from logfire.integrations.pydantic import LogfirePydanticPlugin, get_schema_name
+from logfire.integrations.pydantic import LogfirePydanticPlugin, _compiled_patterns, get_schema_name  # type: ignore
 from logfire.testing import SeededRandomIdGenerator, TestExporter
 from tests.test_metrics import get_collected_metrics
 
@@ -134,6 +134,19 @@ def test_logfire_plugin_include_exclude_models(
         assert result == (None, None, None)
 
 
+def test_include_exclude_patterns_compiled_once() -> None:
+    config = PydanticPlugin(record='all', include={'MyModel'}, exclude={'MyModel1'})
+    include, exclude = _compiled_patterns(config)
+    assert [pattern.pattern for pattern in include] == ['MyModel$']
+    assert [pattern.pattern for pattern in exclude] == ['MyModel1$']
+    assert _compiled_patterns(config) == (include, exclude)
+    assert _compiled_patterns(config)[0][0] is include[0]
+
+    # New settings, e.g. from calling `logfire.configure` again, are compiled afresh.
+    new_include, _ = _compiled_patterns(PydanticPlugin(record='all', include={'Other'}))
+    assert [pattern.pattern for pattern in new_include] == ['Other$']
+
+
 def test_get_schema_name():
     # In particular this tests schemas with type 'definitions'
 